@@ -1,19 +1,30 @@
 import sys
 import os
+import signal
 import textwrap
+import asyncio
 from dotenv import load_dotenv
-import requests
+import aiohttp
 import json
+import hashlib
+import functools
+
+# orjson decodes the ADSB payload several times faster than stdlib json;
+# fall back transparently when it isn't installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 from datetime import datetime
 import time
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 import traceback
 import logging
-import RPi.GPIO as GPIO
 
 # Initialize logging with more detailed format
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
 )
@@ -25,9 +36,11 @@ logger.debug("Environment variables loaded")
 
 # Configuration and Setup
 #----------------------------------------
-# Set up directory paths for resources
-picdir = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'pic')
-libdir = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'lib')
+# Set up directory paths for resources; resolve the project root once
+# instead of walking the symlink chain per path
+basedir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+picdir = os.path.join(basedir, 'pic')
+libdir = os.path.join(basedir, 'lib')
 
 logger.debug(f"Picture directory: {picdir}")
 logger.debug(f"Library directory: {libdir}")
@@ -39,8 +52,11 @@ if os.path.exists(libdir):
 else:
     logger.warning(f"Library directory {libdir} does not exist")
 
+@functools.lru_cache(maxsize=None)
 def check_spi_access():
-    """Check if SPI devices are accessible – if they arent, run raspi-config to enable SPI"""
+    """Check if SPI devices are accessible – if they arent, run raspi-config to enable SPI
+    Cached: device permissions don't change while we run, so later callers
+    skip the os.access syscalls"""
     spi_devices = ['/dev/spidev0.0', '/dev/spidev0.1']
     for device in spi_devices:
         if not os.access(device, os.R_OK | os.W_OK):
@@ -54,51 +70,259 @@ if not check_spi_access():
     sys.exit(1)
 
 logger.debug("Importing E-Ink display module")
-from waveshare_epd import epd7in5_V2
+from waveshare_epd import epd7in5_V2, epdconfig
 logger.debug("E-Ink display module imported")
 
+# One EPD object for the lifetime of the process; it holds only pin numbers
+# and dimensions, so there is no reason to rebuild it every cycle
+epd = epd7in5_V2.EPD()
+
+# Load fonts once at import with fallback, instead of re-reading the TTF
+# files from disk on every display update
+try:
+    FONT = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 24)
+    SMALL_FONT = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 18)
+except Exception as e:
+    logger.warning(f"Font loading failed: {str(e)}, using default font")
+    FONT = ImageFont.load_default()
+    SMALL_FONT = ImageFont.load_default()
+
 # Load environment variables for aircraft tracking
 LATITUDE = os.getenv('LATITUDE')
 LONGITUDE = os.getenv('LONGITUDE')
 RADIUS = os.getenv('RADIUS')
 
+# Base URL for the ADSB API. When several displays share a site, point this
+# at a local aggregator or caching proxy (e.g. a shared readsb/tar1090 box)
+# so they collapse into a single upstream poll instead of each hitting
+# api.adsb.lol separately
+ADSB_BASE_URL = os.getenv('ADSB_BASE_URL', 'https://api.adsb.lol').rstrip('/')
+
 logger.debug(f"Configured tracking parameters - LAT: {LATITUDE}, LON: {LONGITUDE}, RADIUS: {RADIUS}")
 
+# Seconds between ADSB polls
+POLL_INTERVAL = 30
+
+# When polls keep coming back empty there is nothing to show anyway, so
+# back off the interval (doubling per empty poll) up to this ceiling and
+# snap back to POLL_INTERVAL as soon as an aircraft appears
+QUIET_BACKOFF_FACTOR = 2
+MAX_POLL_INTERVAL = 300
+
+# HTTP client settings - one session is reused for every poll so DNS, TCP
+# and TLS handshakes are only paid once (keep-alive), not every 30 seconds
+SESSION_HEADERS = {'User-Agent': 'eink/1.0'}
+SESSION_TIMEOUT = aiohttp.ClientTimeout(connect=3.05, total=10)
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5  # seconds, doubled per attempt
+RETRY_STATUSES = {429, 502, 503, 504}
+
+# Conditional-request cache for the ADSB poll: remembers the validators from
+# the last 200 response so an unchanged snapshot comes back as a cheap 304
+# (no JSON decode) instead of a full body
+_api_cache = {'etag': None, 'last_modified': None, 'payload': None}
+
+# Fields from the API payload that actually end up on the display
+DISPLAY_FIELDS = ('flight', 'r', 't', 'alt_baro', 'gs', 'dst')
+
+# Fingerprint of the last aircraft pushed to the panel; unchanged data means
+# the multi-second e-ink refresh can be skipped entirely
+_last_rendered_hash = None
+
+# Hash of the last pixel buffer actually blitted, as a second guard: different
+# field values can still rasterize to an identical frame
+_last_buf_hash = None
+
+# Partial refreshes are much faster and flash-free, but accumulate ghosting;
+# force a full Clear + refresh after this many partials
+FULL_REFRESH_EVERY = 10
+
+# Partial updates since the last full refresh; None means the panel content
+# is unknown (startup or a failed update) and the next refresh must be full
+_partials_since_full = None
+
+# Copy of the frame currently on the panel; diffed against the next frame
+# to find the dirty window for partial updates
+_last_frame = None
+
+# How the panel was last initialized: None (asleep), 'full' or 'part'.
+# While a mode is set the panel stays powered between updates, skipping the
+# init/sleep pair (and its 2 s module_exit delay) on every cycle
+_display_mode = None
+
+# Seconds without a display update before the panel is put into deep sleep
+DISPLAY_IDLE_TIMEOUT = 180
+
+def aircraft_fingerprint(aircraft_data):
+    """Hash just the fields that get drawn, so irrelevant payload churn
+    (position jitter, signal stats) doesn't force a display refresh"""
+    fields = {key: aircraft_data.get(key) for key in DISPLAY_FIELDS}
+    return hashlib.blake2b(json.dumps(fields, sort_keys=True, default=str).encode()).digest()
+
+def make_session():
+    """Build the shared aiohttp session with a small keep-alive pool"""
+    connector = aiohttp.TCPConnector(limit=2, keepalive_timeout=75)
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers=SESSION_HEADERS,
+        timeout=SESSION_TIMEOUT,
+    )
+
 # API Functions
 #----------------------------------------
-def get_closest_aircraft():
+async def get_closest_aircraft(session):
     """
     Fetch data about the closest aircraft from the ADSB API
+    Args:
+        session: aiohttp.ClientSession reused across calls
     Returns: Dictionary with aircraft data or None if request fails
     """
     logger.debug("Attempting to fetch closest aircraft data")
-    try:
-        url = f'https://api.adsb.lol/v2/closest/{LATITUDE}/{LONGITUDE}/{RADIUS}'
-        logger.debug(f"Making API request to: {url}")
-        
-        response = requests.get(url)
-        logger.debug(f"API response status code: {response.status_code}")
-        
-        if response.status_code == 200:
-            data = response.json()
-            logger.debug(f"Received aircraft data: {json.dumps(data, indent=2)}")
-            
-            # Check if we have any aircraft in the response
-            if data.get('ac') and len(data['ac']) > 0:
-                # Return the first aircraft in the array
-                return data['ac'][0]
-            else:
-                logger.warning("No aircraft found in response")
-                return None
-                
-        else:
-            logger.error(f"API request failed with status code: {response.status_code}")
+    url = f'{ADSB_BASE_URL}/v2/closest/{LATITUDE}/{LONGITUDE}/{RADIUS}'
+
+    # Send the validators from the previous response so an unchanged
+    # snapshot comes back as a body-less 304
+    conditional_headers = {}
+    if _api_cache['etag']:
+        conditional_headers['If-None-Match'] = _api_cache['etag']
+    if _api_cache['last_modified']:
+        conditional_headers['If-Modified-Since'] = _api_cache['last_modified']
+
+    for attempt in range(RETRY_ATTEMPTS):
+        if attempt > 0:
+            backoff = RETRY_BACKOFF * (2 ** (attempt - 1))
+            logger.debug("Retrying in %s seconds (attempt %d/%d)", backoff, attempt + 1, RETRY_ATTEMPTS)
+            await asyncio.sleep(backoff)
+        try:
+            logger.debug("Making API request to: %s", url)
+
+            async with session.get(url, headers=conditional_headers) as response:
+                logger.debug("API response status code: %s", response.status)
+
+                if response.status == 304:
+                    logger.debug("Aircraft data not modified, using cached payload")
+                    return _api_cache['payload']
+
+                if response.status == 200:
+                    data = await response.json(loads=json_loads)
+                    # Log a cheap summary; re-serializing the whole payload
+                    # with json.dumps every poll is pure overhead
+                    logger.debug("Received aircraft data: %d aircraft", len(data.get('ac') or []))
+
+                    _api_cache['etag'] = response.headers.get('ETag')
+                    _api_cache['last_modified'] = response.headers.get('Last-Modified')
+
+                    # Check if we have any aircraft in the response
+                    if data.get('ac') and len(data['ac']) > 0:
+                        # Return the first aircraft in the array
+                        _api_cache['payload'] = data['ac'][0]
+                    else:
+                        logger.warning("No aircraft found in response")
+                        _api_cache['payload'] = None
+                    return _api_cache['payload']
+
+                elif response.status in RETRY_STATUSES:
+                    logger.warning(f"API request got retryable status code: {response.status}")
+                    continue
+
+                else:
+                    logger.error(f"API request failed with status code: {response.status}")
+                    return None
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"API request attempt failed: {str(e)}")
+        except Exception as e:
+            logger.error(f"API request failed with exception: {str(e)}")
+            logger.error(f"Traceback: {traceback.format_exc()}")
             return None
-            
+
+    logger.error(f"API request failed after {RETRY_ATTEMPTS} attempts")
+    return None
+
+# Static layout: labels never change, so they are rasterized once into a
+# base frame and only the value column is drawn per update
+FIELD_LABELS = (
+    "Flight:",
+    "Registration:",
+    "Aircraft Type:",
+    "Altitude:",
+    "Ground Speed:",
+    "Distance:"
+)
+LABEL_X = 30
+VALUE_X = 260  # clears the widest label at 24 pt
+LINE_Y = 30
+LINE_SPACING = 40
+
+# multiline_text steps by bbox("A") height + spacing per line (not
+# ascent + descent); derive the extra spacing from the same metric Pillow
+# uses so rows keep the LINE_SPACING pitch the layout was designed around
+try:
+    MULTILINE_SPACING = LINE_SPACING - FONT.getbbox("A")[3]
+except AttributeError:
+    # Bitmap fallback font has no getbbox; a fixed gap is close enough
+    MULTILINE_SPACING = 12
+
+@functools.lru_cache(maxsize=1)
+def base_frame():
+    """Blank panel-sized frame with the static labels pre-drawn"""
+    image = Image.new('1', (epd7in5_V2.EPD_WIDTH, epd7in5_V2.EPD_HEIGHT), 255)
+    draw = ImageDraw.Draw(image)
+    draw.multiline_text((LABEL_X, LINE_Y), "\n".join(FIELD_LABELS),
+                        font=FONT, fill=0, spacing=MULTILINE_SPACING)
+    return image
+
+@functools.lru_cache(maxsize=32)
+def render_frame(fields):
+    """
+    Render the aircraft fields into a 1-bit frame
+    Starts from the pre-composed label frame and draws only the dynamic
+    values; cached on the field tuple, so a returning aircraft skips the
+    draw.text work entirely
+    Args:
+        fields: Tuple of (flight, registration, aircraft_type, altitude,
+                speed, distance)
+    Returns: PIL Image sized for the panel
+    """
+    flight, registration, aircraft_type, altitude, speed, distance = fields
+
+    image = base_frame().copy()
+    draw = ImageDraw.Draw(image)
+
+    values = [
+        flight,
+        registration,
+        aircraft_type,
+        f"{altitude} ft",
+        f"{speed} knots",
+        f"{distance} NM"
+    ]
+
+    # Draw the value column in one call; PIL lays out all the lines in a
+    # single pass instead of re-entering draw.text per row
+    draw.multiline_text((VALUE_X, LINE_Y), "\n".join(str(value) for value in values),
+                        font=FONT, fill=0, spacing=MULTILINE_SPACING)
+
+    return image
+
+def sleep_display():
+    """
+    Put the panel into deep sleep and forget its mode/content state
+    Safe to call when the panel is already asleep
+    """
+    global _display_mode, _partials_since_full, _last_frame
+    _last_frame = None
+    if _display_mode is None:
+        return
+    logger.debug("Putting display to sleep")
+    try:
+        epd.sleep()
     except Exception as e:
-        logger.error(f"API request failed with exception: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        return None
+        logger.error(f"Error putting display to sleep: {str(e)}")
+    _display_mode = None
+    # Deep sleep invalidates the refresh state; start over with a full
+    # refresh on wake
+    _partials_since_full = None
 
 def update_display(aircraft_data):
     """
@@ -106,128 +330,220 @@ def update_display(aircraft_data):
     Args:
         aircraft_data: Dictionary containing aircraft information
     """
-    epd = None
+    global _last_rendered_hash, _last_buf_hash, _partials_since_full, _display_mode, _last_frame
+
+    # Unchanged data means an identical frame; skip the multi-second
+    # refresh (the dominant time and energy cost) altogether
+    fingerprint = aircraft_fingerprint(aircraft_data)
+    if fingerprint == _last_rendered_hash:
+        logger.debug("Aircraft data unchanged since last render, skipping display update")
+        return
+
+    # Extract the display fields in one pass with a uniform default,
+    # rather than a per-field chain of .get calls
+    fields = {key: aircraft_data.get(key, 'N/A') for key in DISPLAY_FIELDS}
+    field_tuple = (
+        str(fields['flight']).strip(),
+        fields['r'],
+        fields['t'],
+        fields['alt_baro'],
+        fields['gs'],
+        fields['dst']
+    )
+
     logger.debug("Starting display update")
     try:
-        # Initialize display
-        logger.debug("Initializing E-Ink display")
-        epd = epd7in5_V2.EPD()
-        
-        # Initialize with timeout check
-        init_timeout = time.time() + 30  # 30 second timeout
-        epd.init()
-        while epd.digital_read(epd.busy_pin) == 1:
-            if time.time() > init_timeout:
-                raise TimeoutError("Display initialization timed out")
-            time.sleep(0.1)
-        
-        # Clear with timeout check
-        logger.debug("Clearing display")
-        clear_timeout = time.time() + 30
-        epd.Clear()
-        while epd.digital_read(epd.busy_pin) == 1:
-            if time.time() > clear_timeout:
-                raise TimeoutError("Display clear timed out")
-            time.sleep(0.1)
-        
-        # Create canvas
-        image = Image.new('1', (epd.width, epd.height), 255)
+        # Render (or fetch the cached frame) and hash the pixel buffer
+        # before powering anything up, so an identical frame costs nothing
+        frame = render_frame(field_tuple)
+        buf = epd.getbuffer(frame)
+        buf_hash = hashlib.blake2s(bytes(buf)).digest()
+        if buf_hash == _last_buf_hash:
+            logger.debug("Rendered frame identical to previous, skipping display update")
+            _last_rendered_hash = fingerprint
+            return
+
+        # Stamp the refresh time onto a copy so the cached frame stays clean
+        image = frame.copy()
         draw = ImageDraw.Draw(image)
-        
-        # Set up fonts with fallback
-        try:
-            font = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', 24)
-            small_font = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 18)
-        except Exception as e:
-            logger.warning(f"Font loading failed: {str(e)}, using default font")
-            font = ImageFont.load_default()
-            small_font = ImageFont.load_default()
-
-        # Extract and format aircraft data
-        flight = aircraft_data.get('flight', 'N/A').strip()
-        aircraft_type = aircraft_data.get('t', 'N/A')
-        altitude = aircraft_data.get('alt_baro', 'N/A')
-        speed = aircraft_data.get('gs', 'N/A')
-        registration = aircraft_data.get('r', 'N/A')
-        distance = aircraft_data.get('dst', 'N/A')
-        
-        text_lines = [
-            f"Flight: {flight}",
-            f"Registration: {registration}",
-            f"Aircraft Type: {aircraft_type}",
-            f"Altitude: {altitude} ft",
-            f"Ground Speed: {speed} knots",
-            f"Distance: {distance} NM"
-        ]
-
-        # Draw text
-        y_position = 30
-        for line in text_lines:
-            draw.text((30, y_position), line, font=font, fill=0)
-            y_position += 40
-
-        # Add timestamp
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        draw.text((30, y_position + 20), f"Last Updated: {timestamp}", font=small_font, fill=0)
-
-        # Update display with timeout
-        logger.debug("Updating display with new image")
-        display_timeout = time.time() + 30
-        epd.display(epd.getbuffer(image))
-        while epd.digital_read(epd.busy_pin) == 1:
-            if time.time() > display_timeout:
+        timestamp_y = LINE_Y + len(FIELD_LABELS) * LINE_SPACING + 20
+        draw.text((LABEL_X, timestamp_y), f"Last Updated: {timestamp}", font=SMALL_FONT, fill=0)
+
+        full_refresh = (_partials_since_full is None
+                        or _partials_since_full >= FULL_REFRESH_EVERY)
+
+        if full_refresh:
+            # Initialize only when the panel is asleep or in partial mode
+            if _display_mode != 'full':
+                logger.debug("Initializing E-Ink display for full refresh")
+                epd.init()
+                # The panel is powered from this point on, so record the
+                # mode before the wait: a timeout must still reach
+                # sleep_display() in the error path
+                _display_mode = 'full'
+                if not epdconfig.wait_busy(30000):
+                    raise TimeoutError("Display initialization timed out")
+
+            # Clear with timeout check
+            logger.debug("Clearing display")
+            epd.Clear()
+            if not epdconfig.wait_busy(30000):
+                raise TimeoutError("Display clear timed out")
+
+            # Update display with timeout
+            logger.debug("Updating display with new image")
+            epd.display(epd.getbuffer(image))
+            if not epdconfig.wait_busy(30000):
+                raise TimeoutError("Display update timed out")
+            _partials_since_full = 0
+        else:
+            # Windowed update: no Clear, no flashing, roughly half the
+            # refresh time of the full sequence
+            if _display_mode != 'part':
+                logger.debug("Initializing E-Ink display for partial refresh")
+                epd.init_part()
+                # As above: mark the panel powered before waiting so an
+                # init timeout still powers it back down
+                _display_mode = 'part'
+                if not epdconfig.wait_busy(30000):
+                    raise TimeoutError("Display initialization timed out")
+
+            # Diff against the frame on the panel and push only the dirty
+            # rectangle; a changed aircraft usually touches a narrow band,
+            # cutting the SPI payload proportionally
+            bbox = None
+            if _last_frame is not None:
+                bbox = ImageChops.difference(_last_frame, image).getbbox()
+            if bbox is None:
+                bbox = (0, 0, epd.width, epd.height)
+            logger.debug("Updating display with partial refresh, window %s", bbox)
+            epd.display_Partial(epd.getbuffer(image), *bbox)
+            if not epdconfig.wait_busy(30000):
                 raise TimeoutError("Display update timed out")
-            time.sleep(0.1)
-        
+            _partials_since_full += 1
+
+        _last_frame = image
+        _last_rendered_hash = fingerprint
+        _last_buf_hash = buf_hash
         logger.debug("Display update completed successfully")
-        
+
     except Exception as e:
         logger.error(f"Display update failed: {str(e)}")
         logger.error(f"Traceback: {traceback.format_exc()}")
-    finally:
-        if epd is not None:
-            logger.debug("Putting display to sleep")
-            try:
-                epd.sleep()
-            except Exception as e:
-                logger.error(f"Error putting display to sleep: {str(e)}")
+        # Panel state is now unknown; power it down and force a full
+        # refresh on the next update
+        sleep_display()
 
 def wait_for_display_ready(epd, timeout_seconds=10):
     """Helper function to wait for display to be ready with timeout"""
-    timeout = time.time() + timeout_seconds
-    while epd.digital_read(epd.busy_pin) == 1:
-        if time.time() > timeout:
-            raise TimeoutError(f"Display busy timeout after {timeout_seconds} seconds")
-        time.sleep(0.1)
+    if not epdconfig.wait_busy(int(timeout_seconds * 1000)):
+        raise TimeoutError(f"Display busy timeout after {timeout_seconds} seconds")
 
 # Main Execution
 #----------------------------------------
+async def fetcher_loop(queue):
+    """
+    Fetch aircraft data every 30 seconds and hand it to the render loop.
+    Runs independently of the (slow) e-ink refresh, so the next fetch can
+    already be in flight while the display is still busy.
+    """
+    async with make_session() as session:
+        next_poll = time.monotonic()
+        empty_streak = 0
+        while True:
+            logger.debug("Starting new fetch cycle")
+            # closest_aircraft = await get_closest_aircraft(session) // This works.
+            # Use mock data for testing
+            closest_aircraft = {
+                'flight': 'TEST123',
+                'r': 'N12345',
+                't': 'B738',
+                'alt_baro': 35000,
+                'gs': 450,
+                'dst': 12.5
+            }
+            if closest_aircraft:
+                empty_streak = 0
+                # Keep only the freshest snapshot; drop a stale one if the
+                # renderer hasn't picked it up yet.
+                if queue.full():
+                    queue.get_nowait()
+                await queue.put(closest_aircraft)
+            else:
+                empty_streak += 1
+                logger.warning("No aircraft data received (%d empty polls in a row)", empty_streak)
+
+            # Quiet sky: stretch the interval instead of hammering the API
+            # for an unchanged empty answer
+            interval = min(POLL_INTERVAL * QUIET_BACKOFF_FACTOR ** empty_streak,
+                           MAX_POLL_INTERVAL)
+
+            # Schedule against a monotonic deadline so slow fetches and
+            # sleep jitter don't accumulate as drift; if a cycle overran,
+            # reschedule from now rather than firing a burst of polls
+            next_poll += interval
+            now = time.monotonic()
+            if next_poll <= now:
+                logger.warning("Fetch cycle overran its slot; rescheduling from now")
+                next_poll = now + interval
+            logger.debug("Waiting %.1f seconds before next fetch", next_poll - now)
+            await asyncio.sleep(next_poll - now)
+
+async def render_loop(queue):
+    """
+    Pull aircraft snapshots off the queue and push them to the display.
+    The blocking SPI/busy-wait work runs in a worker thread so the event
+    loop (and the fetcher) stay responsive during the ~5 s refresh.
+    The panel stays powered between updates that arrive close together;
+    after DISPLAY_IDLE_TIMEOUT without work it is put into deep sleep.
+    """
+    while True:
+        try:
+            closest_aircraft = await asyncio.wait_for(queue.get(), timeout=DISPLAY_IDLE_TIMEOUT)
+        except asyncio.TimeoutError:
+            await asyncio.to_thread(sleep_display)
+            continue
+        logger.debug("Retrieved aircraft data, updating display")
+        await asyncio.to_thread(update_display, closest_aircraft)
+
+async def main():
+    queue = asyncio.Queue(maxsize=1)
+    fetch_task = asyncio.create_task(fetcher_loop(queue))
+    render_task = asyncio.create_task(render_loop(queue))
+
+    # systemd stops the service with SIGTERM; cancel the tasks so we fall
+    # through to the cleanup below and the panel doesn't stay powered
+    def handle_sigterm():
+        logger.info("Received SIGTERM, shutting down")
+        fetch_task.cancel()
+        render_task.cancel()
+
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, handle_sigterm)
+
+    try:
+        await asyncio.gather(fetch_task, render_task)
+    except asyncio.CancelledError:
+        pass
+
+# uvloop's C event loop cuts scheduling and socket overhead versus the
+# stdlib loop; fall back silently when it isn't installed
+try:
+    import uvloop
+    uvloop.install()
+    logger.debug("Using uvloop event loop")
+except ImportError:
+    logger.debug("uvloop not available, using default event loop")
+
 logger.info("Starting main execution loop")
 try:
-    while True:
-        logger.debug("Starting new update cycle")
-        # closest_aircraft = get_closest_aircraft() // This works.
-        # Use mock data for testing
-        closest_aircraft = {
-            'flight': 'TEST123',
-            'r': 'N12345',
-            't': 'B738',
-            'alt_baro': 35000,
-            'gs': 450,
-            'dst': 12.5
-        }
-        if closest_aircraft:
-            logger.debug("Retrieved aircraft data, updating display")
-            update_display(closest_aircraft)
-        else:
-            logger.warning("No aircraft data received")
-        logger.debug("Waiting 30 seconds before next update")
-        time.sleep(30)
+    asyncio.run(main())
 except KeyboardInterrupt:
     logger.info("Program terminated by user")
 except Exception as e:
     logger.error(f"Main loop error: {str(e)}")
     logger.error(f"Traceback: {traceback.format_exc()}")
 finally:
-    logger.debug("Cleaning up GPIO")
-    GPIO.cleanup()
\ No newline at end of file
+    logger.debug("Cleaning up display and GPIO")
+    sleep_display()
+    epdconfig.module_exit()
\ No newline at end of file
@@ -31,6 +31,11 @@
 import logging
 from . import epdconfig
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Display resolution
 EPD_WIDTH       = 800
 EPD_HEIGHT      = 480
@@ -45,6 +50,12 @@ class EPD:
         self.cs_pin = epdconfig.CS_PIN
         self.width = EPD_WIDTH
         self.height = EPD_HEIGHT
+        # Pre-allocated scratch/constant buffers reused across refreshes,
+        # so no ~48 KB list is built per frame
+        buf_len = EPD_WIDTH * EPD_HEIGHT // 8
+        self._inverted = bytearray(buf_len)
+        self._white = bytes([0xFF]) * buf_len
+        self._black = bytes(buf_len)
     
     # Hardware reset
     def reset(self):
@@ -70,9 +81,15 @@ class EPD:
     def send_data2(self, data):
         epdconfig.digital_write(self.dc_pin, 1)
         epdconfig.digital_write(self.cs_pin, 0)
-        epdconfig.SPI.writebytes2(data)
+        epdconfig.spi_writebyte2(data)
         epdconfig.digital_write(self.cs_pin, 1)
 
+    def send_command_data(self, command, data):
+        # Write a command and its whole parameter list with one DC/CS toggle
+        # per phase instead of toggling the pins around every byte
+        self.send_command(command)
+        self.send_data2(data)
+
     def ReadBusy(self):
         logger.debug("e-Paper busy")
         self.send_command(0x71)
@@ -89,72 +106,46 @@ class EPD:
         # EPD hardware init start
         self.reset()
         
-        self.send_command(0x06)     # btst
-        self.send_data(0x17)
-        self.send_data(0x17)
-        self.send_data(0x28)        # If an exception is displayed, try using 0x38
-        self.send_data(0x17)
-        
-        self.send_command(0x01)			#POWER SETTING
-        self.send_data(0x07)
-        self.send_data(0x07)    #VGH=20V,VGL=-20V
-        self.send_data(0x3f)		#VDH=15V
-        self.send_data(0x3f)		#VDL=-15V
+        self.send_command_data(0x06, [0x17, 0x17, 0x28, 0x17])     # btst; if an exception is displayed, try 0x38 for the third byte
+
+        self.send_command_data(0x01, [0x07, 0x07, 0x3f, 0x3f])			#POWER SETTING: VGH=20V,VGL=-20V VDH=15V VDL=-15V
 
         self.send_command(0x04) #POWER ON
         epdconfig.delay_ms(100)
         self.ReadBusy()
 
-        self.send_command(0X00)			#PANNEL SETTING
-        self.send_data(0x1F)   #KW-3f   KWR-2F	BWROTP 0f	BWOTP 1f
+        self.send_command_data(0X00, [0x1F])			#PANNEL SETTING: KW-3f   KWR-2F	BWROTP 0f	BWOTP 1f
 
-        self.send_command(0x61)        	#tres
-        self.send_data(0x03)		#source 800
-        self.send_data(0x20)
-        self.send_data(0x01)		#gate 480
-        self.send_data(0xE0)
+        self.send_command_data(0x61, [0x03, 0x20, 0x01, 0xE0])        	#tres: source 800, gate 480
 
-        self.send_command(0X15)
-        self.send_data(0x00)
+        self.send_command_data(0X15, [0x00])
 
-        self.send_command(0X50)			#VCOM AND DATA INTERVAL SETTING
-        self.send_data(0x10)
-        self.send_data(0x07)
+        self.send_command_data(0X50, [0x10, 0x07])			#VCOM AND DATA INTERVAL SETTING
 
-        self.send_command(0X60)			#TCON SETTING
-        self.send_data(0x22)
+        self.send_command_data(0X60, [0x22])			#TCON SETTING
 
         # EPD hardware init end
         return 0
-    
+
     def init_fast(self):
         if (epdconfig.module_init() != 0):
             return -1
         # EPD hardware init start
         self.reset()
         
-        self.send_command(0X00)			#PANNEL SETTING
-        self.send_data(0x1F)   #KW-3f   KWR-2F	BWROTP 0f	BWOTP 1f
+        self.send_command_data(0X00, [0x1F])			#PANNEL SETTING: KW-3f   KWR-2F	BWROTP 0f	BWOTP 1f
 
-        self.send_command(0X50)			#VCOM AND DATA INTERVAL SETTING
-        self.send_data(0x10)
-        self.send_data(0x07)
+        self.send_command_data(0X50, [0x10, 0x07])			#VCOM AND DATA INTERVAL SETTING
 
         self.send_command(0x04) #POWER ON
-        epdconfig.delay_ms(100) 
+        epdconfig.delay_ms(100)
         self.ReadBusy()        #waiting for the electronic paper IC to release the idle signal
 
         #Enhanced display drive(Add 0x06 command)
-        self.send_command(0x06)			#Booster Soft Start 
-        self.send_data (0x27)
-        self.send_data (0x27)   
-        self.send_data (0x18)		
-        self.send_data (0x17)		
+        self.send_command_data(0x06, [0x27, 0x27, 0x18, 0x17])			#Booster Soft Start
 
-        self.send_command(0xE0)
-        self.send_data(0x02)
-        self.send_command(0xE5)
-        self.send_data(0x5A)
+        self.send_command_data(0xE0, [0x02])
+        self.send_command_data(0xE5, [0x5A])
 
         # EPD hardware init end
         return 0
@@ -165,17 +156,14 @@ class EPD:
         # EPD hardware init start
         self.reset()
 
-        self.send_command(0X00)			#PANNEL SETTING
-        self.send_data(0x1F)   #KW-3f   KWR-2F	BWROTP 0f	BWOTP 1f
+        self.send_command_data(0X00, [0x1F])			#PANNEL SETTING: KW-3f   KWR-2F	BWROTP 0f	BWOTP 1f
 
         self.send_command(0x04) #POWER ON
-        epdconfig.delay_ms(100) 
+        epdconfig.delay_ms(100)
         self.ReadBusy()        #waiting for the electronic paper IC to release the idle signal
 
-        self.send_command(0xE0)
-        self.send_data(0x02)
-        self.send_command(0xE5)
-        self.send_data(0x6E)
+        self.send_command_data(0xE0, [0x02])
+        self.send_command_data(0xE5, [0x6E])
 
         # EPD hardware init end
         return 0
@@ -193,25 +181,28 @@ class EPD:
             # return a blank buffer
             return [0x00] * (int(self.width/8) * self.height)
 
-        buf = bytearray(img.tobytes('raw'))
+        raw = img.tobytes('raw')
         # The bytes need to be inverted, because in the PIL world 0=black and 1=white, but
         # in the e-paper world 0=white and 1=black.
-        for i in range(len(buf)):
-            buf[i] ^= 0xFF
+        if np is not None:
+            buf = bytearray(np.frombuffer(raw, dtype=np.uint8) ^ 0xFF)
+        else:
+            buf = bytearray(raw)
+            for i in range(len(buf)):
+                buf[i] ^= 0xFF
         return buf
 
     def display(self, image):
-        if(self.width % 8 == 0):
-            Width = self.width // 8
+        # Invert the frame into the reusable scratch buffer for the
+        # old-data RAM instead of building a fresh list per call
+        if np is not None:
+            np.bitwise_xor(np.frombuffer(image, dtype=np.uint8), 0xFF,
+                           out=np.frombuffer(self._inverted, dtype=np.uint8))
         else:
-            Width = self.width // 8 +1
-        Height = self.height
-        image1 = [0xFF] * int(self.width * self.height / 8)
-        for j in range(Height):
-                for i in range(Width):
-                    image1[i + j * Width] = ~image[i + j * Width]
+            for i in range(len(image)):
+                self._inverted[i] = image[i] ^ 0xFF
         self.send_command(0x10)
-        self.send_data2(image1)
+        self.send_data2(self._inverted)
 
         self.send_command(0x13)
         self.send_data2(image)
@@ -222,9 +213,9 @@ class EPD:
 
     def Clear(self):
         self.send_command(0x10)
-        self.send_data2([0xFF] * int(self.width * self.height / 8))
+        self.send_data2(self._white)
         self.send_command(0x13)
-        self.send_data2([0x00] * int(self.width * self.height / 8))
+        self.send_data2(self._black)
 
         self.send_command(0x12)
         epdconfig.delay_ms(100)
@@ -244,32 +235,33 @@ class EPD:
         Width = (Xend - Xstart) // 8
         Height = Yend - Ystart
 	
-        self.send_command(0x50)
-        self.send_data(0xA9)
-        self.send_data(0x07)
+        self.send_command_data(0x50, [0xA9, 0x07])
 
         self.send_command(0x91)		#This command makes the display enter partial mode
-        self.send_command(0x90)		#resolution setting
-        self.send_data (Xstart//256)
-        self.send_data (Xstart%256)   #x-start    
-
-        self.send_data ((Xend-1)//256)		
-        self.send_data ((Xend-1)%256)  #x-end	
-
-        self.send_data (Ystart//256)  #
-        self.send_data (Ystart%256)   #y-start    
-
-        self.send_data ((Yend-1)//256)		
-        self.send_data ((Yend-1)%256)  #y-end
-        self.send_data (0x01)
-
-        image1 = [0xFF] * int(self.width * self.height / 8)
-        for j in range(Height):
+        self.send_command_data(0x90, [		#resolution setting
+            Xstart//256, Xstart%256,        #x-start
+            (Xend-1)//256, (Xend-1)%256,    #x-end
+            Ystart//256, Ystart%256,        #y-start
+            (Yend-1)//256, (Yend-1)%256,    #y-end
+            0x01])
+
+        # Image is a full-frame buffer; carve out just the window rows and
+        # columns so the 0x13 payload is sized to the window instead of
+        # always pushing the whole 48 KB frame
+        stride = self.width // 8
+        x0 = Xstart // 8
+        if np is not None:
+            frame = np.frombuffer(Image, dtype=np.uint8).reshape(self.height, stride)
+            payload = (frame[Ystart:Yend, x0:x0 + Width] ^ 0xFF).tobytes()
+        else:
+            payload = bytearray(Width * Height)
+            for j in range(Height):
+                row = (Ystart + j) * stride + x0
                 for i in range(Width):
-                    image1[i + j * Width] = ~Image[i + j * Width]
+                    payload[j * Width + i] = Image[row + i] ^ 0xFF
 
         self.send_command(0x13)   #Write Black and White image to RAM
-        self.send_data2(image1)
+        self.send_data2(payload)
 
         self.send_command(0x12)
         epdconfig.delay_ms(100)
@@ -3,7 +3,7 @@ import logging
 import sys
 import time
 import spidev
-import RPi.GPIO as GPIO
+from gpiozero import LED, Button
 
 # Pin definition
 RST_PIN         = 17
@@ -16,15 +16,51 @@ EPD_WIDTH       = 800
 EPD_HEIGHT      = 480
 
 class RaspberryPi:
+    # gpiozero with the lgpio pin factory: pin writes go through the
+    # /dev/gpiochip character device instead of RPi.GPIO's sysfs path,
+    # and BUSY edge waits block on a kernel event instead of a thread
     def __init__(self):
-        self.GPIO = GPIO
         self.SPI = spidev.SpiDev()
+        self.GPIO_RST_PIN = None
+        self.GPIO_DC_PIN = None
+        self.GPIO_BUSY_PIN = None
 
     def digital_write(self, pin, value):
-        self.GPIO.output(pin, value)
+        if pin == RST_PIN:
+            device = self.GPIO_RST_PIN
+        elif pin == DC_PIN:
+            device = self.GPIO_DC_PIN
+        elif pin == CS_PIN:
+            # GPIO 8 is hardware CE0, owned by the spi0 kernel driver while
+            # SPI is enabled; claiming it through the character device would
+            # fail with "GPIO busy". spidev asserts chip-select itself around
+            # every transfer, so the manual toggles are a no-op here.
+            return
+        else:
+            raise ValueError("Unknown output pin: %r" % pin)
+        if value:
+            device.on()
+        else:
+            device.off()
 
     def digital_read(self, pin):
-        return self.GPIO.input(pin)
+        if pin == BUSY_PIN:
+            return int(self.GPIO_BUSY_PIN.value)
+        raise ValueError("Unknown input pin: %r" % pin)
+
+    def wait_busy(self, timeout_ms):
+        """
+        Sleep in the kernel until the BUSY pin returns to idle, instead of
+        polling it. Returns True if the panel went idle within timeout_ms,
+        False on timeout.
+        """
+        # On the 7in5_V2 BUSY is LOW while the controller is working and
+        # HIGH when idle (see EPD.ReadBusy). The pin may already be idle;
+        # waiting then would block until the *next* rising edge.
+        if self.GPIO_BUSY_PIN.value == 1:
+            return True
+        self.GPIO_BUSY_PIN.wait_for_press(timeout=timeout_ms / 1000.0)
+        return self.GPIO_BUSY_PIN.value == 1
 
     def delay_ms(self, delaytime):
         time.sleep(delaytime / 1000.0)
@@ -36,28 +72,39 @@ class RaspberryPi:
         self.SPI.writebytes2(data)
 
     def module_init(self):
-        self.GPIO.setmode(self.GPIO.BCM)
-        self.GPIO.setwarnings(False)
-        self.GPIO.setup(RST_PIN, self.GPIO.OUT)
-        self.GPIO.setup(DC_PIN, self.GPIO.OUT)
-        self.GPIO.setup(CS_PIN, self.GPIO.OUT)
-        self.GPIO.setup(BUSY_PIN, self.GPIO.IN)
-
-        # Initialize SPI
-        self.SPI.open(0, 0)  # Open SPI port 0, device (CS) 0
-        self.SPI.max_speed_hz = 4000000
-        self.SPI.mode = 0b00
+        # The panel is re-initialized on every full/partial mode switch
+        # without an intervening module_exit, so only claim the lines and
+        # open SPI if a previous exit released them: SpiDev.open on an
+        # already-open device silently leaks the old file descriptor
+        if self.GPIO_RST_PIN is None:
+            self.GPIO_RST_PIN = LED(RST_PIN)
+            self.GPIO_DC_PIN = LED(DC_PIN)
+            self.GPIO_BUSY_PIN = Button(BUSY_PIN, pull_up=False)
+
+            # Initialize SPI
+            self.SPI.open(0, 0)  # Open SPI port 0, device (CS) 0
+            # The UC8179 controller accepts writes well above the conservative
+            # 4 MHz default; 10 MHz cuts the full-frame blit time by ~60%
+            self.SPI.max_speed_hz = 10000000
+            self.SPI.mode = 0b00
         return 0
 
     def module_exit(self):
+        if self.GPIO_RST_PIN is None:
+            return
+
         logging.debug("spi end")
         self.SPI.close()
 
         logging.debug("close 5V, Module enters 0 power consumption ...")
-        self.GPIO.output(RST_PIN, 0)
-        self.GPIO.output(DC_PIN, 0)
+        self.GPIO_RST_PIN.off()
+        self.GPIO_DC_PIN.off()
 
-        self.GPIO.cleanup([RST_PIN, DC_PIN, CS_PIN, BUSY_PIN])
+        for device in (self.GPIO_RST_PIN, self.GPIO_DC_PIN, self.GPIO_BUSY_PIN):
+            device.close()
+        self.GPIO_RST_PIN = None
+        self.GPIO_DC_PIN = None
+        self.GPIO_BUSY_PIN = None
 
 # Export the GPIO pins and SPI device
 RST_PIN = RST_PIN
@@ -80,6 +127,9 @@ def digital_write(pin, value):
 def digital_read(pin):
     return implementation.digital_read(pin)
 
+def wait_busy(timeout_ms):
+    return implementation.wait_busy(timeout_ms)
+
 def delay_ms(delaytime):
     implementation.delay_ms(delaytime)
 
@@ -87,4 +137,4 @@ def spi_writebyte(data):
     implementation.spi_writebyte(data)
 
 def spi_writebyte2(data):
-    implementation.spi_writebyte2(data)
\ No newline at end of file
+    implementation.spi_writebyte2(data)